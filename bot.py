@@ -1,19 +1,40 @@
+import io
 import os
+import re
+import sys
+import socket
+import operator
+import gzip
+import asyncio
 import logging
-import json
+import functools
+from datetime import timedelta
 from typing import Optional, List, Dict, Any
 
+import aiohttp
 import discord
 from discord import app_commands, Embed, Object
 from discord.ext import commands
 from dotenv import load_dotenv
 
+try:
+    import orjson as _json  # faster parser; falls back to stdlib below
+except ImportError:
+    import json as _json
+
+# Bound once to skip attribute resolution in per-command paths
+_MISSING = discord.utils.MISSING
+_utcnow = discord.utils.utcnow
+_PermissionOverwrite = discord.PermissionOverwrite
+
 # ----------------------------
 # Env & basic setup
 # ----------------------------
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 GUILD_ID = os.getenv("GUILD_ID")
+# Slash commands are only pushed to Discord on `python bot.py --sync` or the owner-only !sync command
+SYNC_ON_START = "--sync" in sys.argv[1:]
 
 # Intents: enable message_content for transcripts
 intents = discord.Intents.default()
@@ -26,12 +47,8 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(me
 # ----------------------------
 # Load config
 # ----------------------------
-CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.json")
-if os.path.exists(CONFIG_PATH):
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        CONFIG = json.load(f)
-else:
-    CONFIG = {
+def _default_config() -> Dict[str, Any]:
+    return {
         "announcement_channel_ids": [],
         "brand": {
             "name": "Rusty Tiger",
@@ -52,6 +69,35 @@ else:
         }
     }
 
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.json")
+if os.path.exists(CONFIG_PATH):
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        CONFIG = _json.loads(f.read())
+else:
+    CONFIG = _default_config()
+
+def _parse_config_id(key: str, value: Any) -> Optional[int]:
+    # A bad ID disables just that setting instead of stopping the bot at import
+    if not value:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        logging.error(f"Ignoring config {key}: {value!r} is not a numeric Discord ID")
+        return None
+
+# Frequently accessed config sections, resolved once at load
+BRAND: Dict[str, Any] = CONFIG.get("brand") or {}
+TCFG: Dict[str, Any] = CONFIG.get("tickets") or {}
+TICKET_PREFIX: str = (TCFG.get("ticket_prefix") or "ticket").lower()
+TICKET_CATEGORY_ID: Optional[int] = _parse_config_id("tickets.category_id", TCFG.get("category_id"))
+TICKET_SUPPORT_ROLE_ID: Optional[int] = _parse_config_id("tickets.support_role_id", TCFG.get("support_role_id"))
+TICKET_TRANSCRIPTS_CHANNEL_ID: Optional[int] = _parse_config_id("tickets.transcripts_channel_id", TCFG.get("transcripts_channel_id"))
+ANNOUNCEMENT_CHANNEL_IDS: List[int] = [
+    cid for cid in (_parse_config_id("announcement_channel_ids", x) for x in CONFIG.get("announcement_channel_ids") or [])
+    if cid is not None
+]
+
 # ----------------------------
 # Helpers (embed styling, color, newlines, JSON parsing)
 # ----------------------------
@@ -67,10 +113,8 @@ COLOR_MAP = {
     "gold": 0xF59E0B,
 }
 
-def parse_color(value: Optional[str]) -> int:
-    if not value:
-        brand_color = (CONFIG.get("brand") or {}).get("color")
-        return parse_color(brand_color) if brand_color else COLOR_MAP["orange"]
+@functools.lru_cache(maxsize=256)
+def _parse_color_str(value: str) -> int:
     v = value.strip().lower()
     if v in COLOR_MAP:
         return COLOR_MAP[v]
@@ -80,22 +124,30 @@ def parse_color(value: Optional[str]) -> int:
     except Exception:
         return COLOR_MAP["orange"]
 
+def parse_color(value: Optional[str]) -> int:
+    if not value:
+        return BRAND_COLOR_INT
+    return _parse_color_str(value)
+
+BRAND_COLOR_INT: int = _parse_color_str(BRAND["color"]) if BRAND.get("color") else COLOR_MAP["orange"]
+
 def list_or_none(x: Optional[str]) -> Optional[List[Any]]:
     if not x:
         return None
     try:
-        obj = json.loads(x)
+        obj = _json.loads(x)
         return obj if isinstance(obj, list) else None
     except Exception:
         return None
 
+# Literal escape sequences typed into slash-command options -> real characters
+_MULTILINE_RE = re.compile(r"\\r\\n|\\n|\\t")
+_MULTILINE_REPL = {"\\r\\n": "\n", "\\n": "\n", "\\t": "\t"}
+
 def normalize_multiline(s: Optional[str]) -> Optional[str]:
     if s is None:
         return None
-    return (s
-            .replace("\\r\\n", "\n")
-            .replace("\\n", "\n")
-            .replace("\\t", "\t"))
+    return _MULTILINE_RE.sub(lambda m: _MULTILINE_REPL[m.group(0)], s)
 
 def make_announcement_embed(
     text: str,
@@ -108,18 +160,17 @@ def make_announcement_embed(
     author_name: Optional[str] = None,
     author_icon: Optional[str] = None,
 ) -> Embed:
-    brand = CONFIG.get("brand") or {}
-    chosen_color = parse_color(color or brand.get("color"))
+    chosen_color = parse_color(color)
     emb = Embed(
         title=title or "📣 Announcement",
         description=text,
         color=chosen_color
     )
-    emb.url = url or discord.utils.MISSING
-    emb.timestamp = discord.utils.utcnow()
+    emb.url = url or _MISSING
+    emb.timestamp = _utcnow()
 
-    _author_name = author_name or brand.get("name")
-    _author_icon = author_icon or brand.get("author_icon") or None
+    _author_name = author_name or BRAND.get("name")
+    _author_icon = author_icon or BRAND.get("author_icon") or None
     if _author_name:
         if _author_icon:
             emb.set_author(name=_author_name, icon_url=_author_icon)
@@ -131,7 +182,7 @@ def make_announcement_embed(
     if image:
         emb.set_image(url=image)
 
-    footer_text = footer or brand.get("footer_text")
+    footer_text = footer or BRAND.get("footer_text")
     if footer_text:
         emb.set_footer(text=footer_text)
 
@@ -172,44 +223,56 @@ class TicketReasonModal(discord.ui.Modal, title="Open a Ticket"):
         await create_ticket_channel(interaction, self.opener, str(self.reason))
 
 class TicketPanelView(discord.ui.View):
-    def __init__(self, opener: Optional[discord.Member] = None):
+    def __init__(self):
         super().__init__(timeout=None)
-        self.opener = opener
 
-    @discord.ui.button(label=(CONFIG.get("tickets") or {}).get("button_label", "🎟️ Open Ticket"),
+    @discord.ui.button(label=TCFG.get("button_label", "🎟️ Open Ticket"),
                        style=discord.ButtonStyle.primary, custom_id="ticket_open_button")
     async def open_ticket(self, interaction: discord.Interaction, button: discord.ui.Button):
         modal = TicketReasonModal(opener=interaction.user)
         await interaction.response.send_modal(modal)
 
+# Stateless, so one instance serves every panel; created in setup_hook since View needs a running loop
+TICKET_PANEL_VIEW: Optional[TicketPanelView] = None
+
+class LinkButtons(discord.ui.View):
+    def __init__(self, buttons: Optional[List[Dict[str, str]]] = None):
+        super().__init__(timeout=None)
+        buttons = buttons or []
+        for b in buttons[:5]:
+            label = str(b.get("label", "Open"))
+            burl = str(b.get("url", "https://discord.com"))
+            if burl.startswith("http://") or burl.startswith("https://"):
+                self.add_item(discord.ui.Button(label=label, url=burl))
+
+# Per-ticket channel permissions for the opener, the bot and support staff
+_BASE_MEMBER_PERMS: Dict[str, bool] = dict(view_channel=True, send_messages=True, read_message_history=True, attach_files=True, embed_links=True)
+_BOT_PERMS: Dict[str, bool] = {**_BASE_MEMBER_PERMS, "manage_channels": True}
+_STAFF_PERMS: Dict[str, bool] = {**_BASE_MEMBER_PERMS, "manage_messages": True}
+
 async def create_ticket_channel(interaction: discord.Interaction, opener: discord.Member, reason: str):
-    tcfg = CONFIG.get("tickets") or {}
     guild = interaction.guild
     if guild is None:
         return await interaction.response.send_message("❌ Tickets must be used in a server.", ephemeral=True)
 
     # Category
-    category_id = tcfg.get("category_id")
-    category = guild.get_channel(int(category_id)) if category_id else None
-    if category_id and not isinstance(category, discord.CategoryChannel):
+    category = guild.get_channel(TICKET_CATEGORY_ID) if TICKET_CATEGORY_ID else None
+    if TICKET_CATEGORY_ID and not isinstance(category, discord.CategoryChannel):
         category = None
 
     # Role
-    support_role_id = tcfg.get("support_role_id")
-    support_role = guild.get_role(int(support_role_id)) if support_role_id else None
+    support_role = guild.get_role(TICKET_SUPPORT_ROLE_ID) if TICKET_SUPPORT_ROLE_ID else None
 
     # Channel name
-    prefix = (tcfg.get("ticket_prefix") or "ticket").lower()
-    channel_name = f"{prefix}-{opener.name[:20].lower()}-{interaction.id % 10000:04d}"
+    channel_name = f"{TICKET_PREFIX}-{opener.name[:20].lower()}-{interaction.id % 10000:04d}"
 
     # Overwrites: only opener + staff can view
     overwrites = {
-        guild.default_role: discord.PermissionOverwrite(view_channel=False),
-        opener: discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True, attach_files=True, embed_links=True),
-        guild.me: discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True, manage_channels=True, attach_files=True, embed_links=True),
+        guild.default_role: _PermissionOverwrite(view_channel=False),
+        opener: _PermissionOverwrite(**_BASE_MEMBER_PERMS),
+        guild.me: _PermissionOverwrite(**_BOT_PERMS),
+        **({support_role: _PermissionOverwrite(**_STAFF_PERMS)} if support_role else {}),
     }
-    if support_role:
-        overwrites[support_role] = discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True, attach_files=True, embed_links=True, manage_messages=True)
 
     channel = await guild.create_text_channel(
         name=channel_name,
@@ -232,46 +295,129 @@ async def create_ticket_channel(interaction: discord.Interaction, opener: discor
     except discord.InteractionResponded:
         pass
 
+# Transcript history is paged over this many snowflake windows, all fetched concurrently.
+# Tickets younger than the min age usually fit in a page or two, so they use one window.
+TRANSCRIPT_FETCH_WINDOWS = 4
+TRANSCRIPT_SPLIT_MIN_AGE = timedelta(days=1)
+# Transcripts are gzipped before upload; 6 trades a little CPU for a much smaller file
+TRANSCRIPT_GZIP_LEVEL = 6
+
+_get_embed_fields = operator.attrgetter("title", "description")
+
+def _format_transcript_message(msg: discord.Message) -> str:
+    msg_author = msg.author
+    embeds = msg.embeds
+    attachments = msg.attachments
+    content = msg.content
+    author = f"{msg_author} ({msg_author.id})"
+    ts = msg.created_at.strftime("%Y-%m-%d %H:%M:%S UTC")
+    prefix = f"[{ts}] {author}"
+    parts: List[str] = []
+    # include basic embed summaries
+    if embeds:
+        for idx, e in enumerate(embeds, start=1):
+            title, desc = _get_embed_fields(e)
+            parts.append(f"{prefix} (EMBED {idx}) Title: {title or ''}\n{desc or ''}\n")
+    if content:
+        parts.append(f"{prefix}: {content}\n")
+    if attachments:
+        for a in attachments:
+            parts.append(f"{prefix} attached: {a.url}\n")
+    return "".join(parts)
+
+async def _fetch_history_window(
+    channel: discord.TextChannel,
+    after: discord.abc.Snowflake,
+    before: Optional[discord.abc.Snowflake],
+    out: "asyncio.Queue[Optional[bytes]]",
+):
+    # Push each message's encoded text as it arrives; None marks the end of the window
+    try:
+        async for msg in channel.history(limit=None, after=after, before=before, oldest_first=True):
+            text = _format_transcript_message(msg)
+            if text:
+                out.put_nowait(text.encode("utf-8"))
+    finally:
+        out.put_nowait(None)
+
 async def generate_text_transcript(channel: discord.TextChannel) -> str:
     """
-    Returns the path to a text transcript file saved in ./transcripts/.
+    Returns the path to a gzipped text transcript file saved in ./transcripts/.
     """
     os.makedirs("transcripts", exist_ok=True)
-    safe_name = f"{channel.name}-{channel.id}.txt"
+    safe_name = f"{channel.name}-{channel.id}.txt.gz"
     path = os.path.join("transcripts", safe_name)
 
-    lines: List[str] = []
-    lines.append(f"Transcript for #{channel.name} ({channel.id}) in {channel.guild.name}\n")
-    lines.append(f"Channel created at: {channel.created_at} UTC\n")
-    lines.append("=" * 60 + "\n")
-
-    async for msg in channel.history(limit=None, oldest_first=True):
-        author = f"{msg.author} ({msg.author.id})"
-        ts = msg.created_at.strftime("%Y-%m-%d %H:%M:%S UTC")
-        content = msg.content or ""
-        # include basic embed summaries
-        if msg.embeds:
-            for idx, e in enumerate(msg.embeds, start=1):
-                title = e.title or ""
-                desc = e.description or ""
-                lines.append(f"[{ts}] {author} (EMBED {idx}) Title: {title}\n{desc}\n")
-        if content:
-            lines.append(f"[{ts}] {author}: {content}\n")
-        if msg.attachments:
-            for a in msg.attachments:
-                lines.append(f"[{ts}] {author} attached: {a.url}\n")
-
-    with open(path, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+    # Split channel lifetime into snowflake ranges [lo, hi) and page them concurrently
+    now = _utcnow()
+    windows = TRANSCRIPT_FETCH_WINDOWS if now - channel.created_at >= TRANSCRIPT_SPLIT_MIN_AGE else 1
+    start = channel.id
+    end = discord.utils.time_snowflake(now)
+    step = max((end - start) // windows, 1)
+    bounds = [start + step * i for i in range(windows)]
+    queues: List["asyncio.Queue[Optional[bytes]]"] = [asyncio.Queue() for _ in bounds]
+    fetches = [
+        asyncio.create_task(_fetch_history_window(
+            channel,
+            after=Object(id=lo - 1),
+            before=Object(id=bounds[i + 1]) if i + 1 < len(bounds) else None,
+            out=queues[i],
+        ))
+        for i, lo in enumerate(bounds)
+    ]
+
+    try:
+        with gzip.open(path, "wb", compresslevel=TRANSCRIPT_GZIP_LEVEL) as f:
+            header = (
+                f"Transcript for #{channel.name} ({channel.id}) in {channel.guild.name}\n"
+                f"Channel created at: {channel.created_at} UTC\n"
+                + "=" * 60 + "\n"
+            )
+            f.write(header.encode("utf-8"))
+
+            # Windows are disjoint and ordered, so draining them in order keeps oldest_first.
+            # The window being drained streams straight to disk; only later ones buffer.
+            for fetch, queue in zip(fetches, queues):
+                while True:
+                    chunk = await queue.get()
+                    if chunk is None:
+                        break
+                    f.write(chunk)
+                await fetch  # re-raises if this window failed
+    except BaseException:
+        for fetch in fetches:
+            fetch.cancel()
+        await asyncio.gather(*fetches, return_exceptions=True)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        raise
+
     return path
 
 # ----------------------------
 # Events
 # ----------------------------
+@bot.event
+async def setup_hook():
+    global TICKET_PANEL_VIEW
+    # Persistent panel: rebinds "ticket_open_button" on panels posted before a restart
+    TICKET_PANEL_VIEW = TicketPanelView()
+    bot.add_view(TICKET_PANEL_VIEW)
+    # Runs once per process (unlike on_ready, which fires on every reconnect)
+    if SYNC_ON_START:
+        await sync_commands()
+
 @bot.event
 async def on_ready():
     logging.info(f"✅ Logged in as {bot.user} (ID: {bot.user.id})")
+
+@bot.command(name="sync", hidden=True)
+@commands.is_owner()
+async def sync(ctx: commands.Context):
     await sync_commands()
+    await ctx.reply("✅ Slash commands synced.")
 
 # ----------------------------
 # Slash Commands (existing + tickets)
@@ -368,19 +514,9 @@ async def announce(
         author_icon=author_icon,
     )
 
-    class LinkButtons(discord.ui.View):
-        def __init__(self, buttons: Optional[List[Dict[str, str]]] = None):
-            super().__init__(timeout=None)
-            buttons = buttons or []
-            for b in buttons[:5]:
-                label = str(b.get("label", "Open"))
-                burl = str(b.get("url", "https://discord.com"))
-                if burl.startswith("http://") or burl.startswith("https://"):
-                    self.add_item(discord.ui.Button(label=label, url=burl))
-
     buttons_list = list_or_none(buttons_json)
     if not buttons_list:
-        buttons_list = (CONFIG.get("brand") or {}).get("default_buttons") or []
+        buttons_list = BRAND.get("default_buttons") or []
     view = LinkButtons(buttons=buttons_list)
 
     content = ping_role.mention if ping_role else None
@@ -412,8 +548,7 @@ async def announce_all(
     url: Optional[str] = None,
     buttons_json: Optional[str] = None,
 ):
-    channel_ids = CONFIG.get("announcement_channel_ids", [])
-    if not channel_ids:
+    if not ANNOUNCEMENT_CHANNEL_IDS:
         await interaction.response.send_message("ℹ️ No channel IDs set in config.json.", ephemeral=True)
         return
 
@@ -421,57 +556,46 @@ async def announce_all(
 
     emb = make_announcement_embed(text=message, title=title, color=color, url=url)
 
-    class LinkButtons(discord.ui.View):
-        def __init__(self, buttons: Optional[List[Dict[str, str]]] = None):
-            super().__init__(timeout=None)
-            buttons = buttons or []
-            for b in buttons[:5]:
-                label = str(b.get("label", "Open"))
-                burl = str(b.get("url", "https://discord.com"))
-                if burl.startswith("http://") or burl.startswith("https://"):
-                    self.add_item(discord.ui.Button(label=label, url=burl))
-
     buttons_list = list_or_none(buttons_json)
     if not buttons_list:
-        buttons_list = (CONFIG.get("brand") or {}).get("default_buttons") or []
-    view = LinkButtons(buttons=buttons_list)
+        buttons_list = BRAND.get("default_buttons") or []
+    view = LinkButtons(buttons=buttons_list) if buttons_list else None
 
-    sent = 0
-    failed = 0
-    for cid in channel_ids:
-        ch = bot.get_channel(int(cid))
-        if isinstance(ch, (discord.TextChannel, discord.Thread)):
-            try:
-                await ch.send(embed=emb, view=view if buttons_list else None)
-                sent += 1
-            except Exception:
-                failed += 1
-        else:
-            failed += 1
+    channels = [bot.get_channel(cid) for cid in ANNOUNCEMENT_CHANNEL_IDS]
+    channels = [ch for ch in channels if isinstance(ch, (discord.TextChannel, discord.Thread))]
+    failed = len(ANNOUNCEMENT_CHANNEL_IDS) - len(channels)
+
+    # Fan out the sends concurrently instead of awaiting each channel in turn
+    results = await asyncio.gather(*(ch.send(embed=emb, view=view) for ch in channels), return_exceptions=True)
+    errors = sum(1 for r in results if isinstance(r, Exception))
+    sent = len(results) - errors
+    failed += errors
 
     await interaction.response.send_message(f"📣 Done. Sent: {sent} | Failed: {failed}", ephemeral=True)
 
 # -------- Ticket commands --------
+def _is_ticket_channel(ch: Any) -> bool:
+    return isinstance(ch, discord.TextChannel) and ch.name.startswith(TICKET_PREFIX)
+
 @bot.tree.command(name="ticket_setup", description="Post a ticket panel with an Open Ticket button.")
 @app_commands.describe(channel="Channel to post the panel (optional)")
 async def ticket_setup(interaction: discord.Interaction, channel: Optional[discord.abc.GuildChannel] = None):
-    tcfg = CONFIG.get("tickets") or {}
     target = channel or interaction.channel
     if not isinstance(target, discord.TextChannel):
         return await interaction.response.send_message("❌ Choose a text channel.", ephemeral=True)
 
     emb = make_announcement_embed(
-        text=normalize_multiline(tcfg.get("panel_description") or "Click below to open a ticket."),
-        title=tcfg.get("panel_title") or "Need Help?",
+        text=normalize_multiline(TCFG.get("panel_description") or "Click below to open a ticket."),
+        title=TCFG.get("panel_title") or "Need Help?",
         color="orange"
     )
-    await target.send(embed=emb, view=TicketPanelView())
+    await target.send(embed=emb, view=TICKET_PANEL_VIEW)
     await interaction.response.send_message("✅ Ticket panel posted.", ephemeral=True)
 
 @bot.tree.command(name="ticket_claim", description="Claim the current ticket channel.")
 async def ticket_claim(interaction: discord.Interaction):
     ch = interaction.channel
-    if not isinstance(ch, discord.TextChannel) or not ch.name.startswith((CONFIG.get("tickets") or {}).get("ticket_prefix", "ticket")):
+    if not _is_ticket_channel(ch):
         return await interaction.response.send_message("❌ Use this inside a ticket channel.", ephemeral=True)
     await interaction.response.send_message(f"🛠️ Ticket claimed by {interaction.user.mention}.", ephemeral=False)
 
@@ -479,16 +603,16 @@ async def ticket_claim(interaction: discord.Interaction):
 @app_commands.describe(user="User to add")
 async def ticket_add(interaction: discord.Interaction, user: discord.Member):
     ch = interaction.channel
-    if not isinstance(ch, discord.TextChannel) or not ch.name.startswith((CONFIG.get("tickets") or {}).get("ticket_prefix", "ticket")):
+    if not _is_ticket_channel(ch):
         return await interaction.response.send_message("❌ Use this inside a ticket channel.", ephemeral=True)
-    await ch.set_permissions(user, view_channel=True, send_messages=True, read_message_history=True, attach_files=True, embed_links=True)
+    await ch.set_permissions(user, **_BASE_MEMBER_PERMS)
     await interaction.response.send_message(f"✅ Added {user.mention} to this ticket.", ephemeral=False)
 
 @bot.tree.command(name="ticket_remove", description="Remove a user from this ticket.")
 @app_commands.describe(user="User to remove")
 async def ticket_remove(interaction: discord.Interaction, user: discord.Member):
     ch = interaction.channel
-    if not isinstance(ch, discord.TextChannel) or not ch.name.startswith((CONFIG.get("tickets") or {}).get("ticket_prefix", "ticket")):
+    if not _is_ticket_channel(ch):
         return await interaction.response.send_message("❌ Use this inside a ticket channel.", ephemeral=True)
     await ch.set_permissions(user, overwrite=None)
     await interaction.response.send_message(f"✅ Removed {user.mention} from this ticket.", ephemeral=False)
@@ -497,7 +621,7 @@ async def ticket_remove(interaction: discord.Interaction, user: discord.Member):
 @app_commands.describe(reason="Reason for closing (optional)")
 async def ticket_close(interaction: discord.Interaction, reason: Optional[str] = None):
     ch = interaction.channel
-    if not isinstance(ch, discord.TextChannel) or not ch.name.startswith((CONFIG.get("tickets") or {}).get("ticket_prefix", "ticket")):
+    if not _is_ticket_channel(ch):
         return await interaction.response.send_message("❌ Use this inside a ticket channel.", ephemeral=True)
 
     await interaction.response.send_message("🔒 Closing ticket and generating transcript...", ephemeral=True)
@@ -506,9 +630,7 @@ async def ticket_close(interaction: discord.Interaction, reason: Optional[str] =
     filepath = await generate_text_transcript(ch)
 
     # Post to transcripts channel
-    tcfg = CONFIG.get("tickets") or {}
-    transcripts_channel_id = tcfg.get("transcripts_channel_id")
-    transcripts_ch = ch.guild.get_channel(int(transcripts_channel_id)) if transcripts_channel_id else None
+    transcripts_ch = ch.guild.get_channel(TICKET_TRANSCRIPTS_CHANNEL_ID) if TICKET_TRANSCRIPTS_CHANNEL_ID else None
 
     close_embed = make_announcement_embed(
         text=f"Ticket **#{ch.name}** closed by {interaction.user.mention}.\n"
@@ -517,17 +639,21 @@ async def ticket_close(interaction: discord.Interaction, reason: Optional[str] =
         color="green"
     )
 
-    if transcripts_ch and isinstance(transcripts_ch, discord.TextChannel):
-        try:
-            await transcripts_ch.send(embed=close_embed, file=discord.File(filepath))
-        except Exception as e:
-            logging.exception(f"Failed to post transcript: {e}")
-
-    # Attach transcript in the ticket for final record then delete
-    try:
-        await ch.send(embed=close_embed, file=discord.File(filepath))
-    except Exception:
-        pass
+    # Read the transcript once and post it to the transcripts channel and the ticket in parallel
+    with open(filepath, "rb") as f:
+        data = f.read()
+    filename = os.path.basename(filepath)
+    targets: List[discord.TextChannel] = [ch]
+    if isinstance(transcripts_ch, discord.TextChannel):
+        targets.insert(0, transcripts_ch)
+    results = await asyncio.gather(
+        *(t.send(embed=close_embed, file=discord.File(io.BytesIO(data), filename=filename)) for t in targets),
+        return_exceptions=True,
+    )
+    for target, result in zip(targets, results):
+        # The copy in the ticket itself is best-effort; the channel is deleted right after
+        if target is not ch and isinstance(result, Exception):
+            logging.error(f"Failed to post transcript: {result}", exc_info=result)
 
     # Delete the channel
     try:
@@ -538,7 +664,18 @@ async def ticket_close(interaction: discord.Interaction, reason: Optional[str] =
 # ----------------------------
 # Entry
 # ----------------------------
+async def main():
+    # Mirrors discord.py's own connector (unlimited pool, IPv4 only since discord does not
+    # support ipv6) but caches DNS for 5 min instead of 10s. Must be built inside the running
+    # loop, before login creates the HTTP session.
+    bot.http.connector = aiohttp.TCPConnector(limit=0, family=socket.AF_INET, ttl_dns_cache=300)
+    async with bot:
+        await bot.start(TOKEN)
+
 if __name__ == "__main__":
     if not TOKEN:
         raise SystemExit("DISCORD_TOKEN not set. Put it in .env (see .env.example).")
-    bot.run(TOKEN)
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass